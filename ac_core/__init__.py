@@ -21,6 +21,8 @@ Example Usage:
     )
 """
 
+import functools
+
 from .models import SignalRaw
 from .database_manager import DatabaseManager
 from .signal_inserter import SignalInserter
@@ -31,6 +33,43 @@ __email__ = "team@alphacrucible.com"
 
 __all__ = [
     "SignalRaw",
-    "DatabaseManager", 
+    "DatabaseManager",
     "SignalInserter",
+    "get_inserter",
 ]
+
+
+@functools.lru_cache(maxsize=None)
+def _build_inserter(config_items: tuple) -> SignalInserter:
+    """Construct and cache one SignalInserter per configuration."""
+    return SignalInserter(**dict(config_items))
+
+
+def get_inserter(**kwargs) -> SignalInserter:
+    """
+    Return a shared SignalInserter for the given configuration.
+
+    Constructing a SignalInserter per call site means a fresh connection
+    pool and table check each time; this factory caches one instance per
+    distinct set of keyword arguments, so repeated callers — request
+    handlers, scheduled jobs — reuse the pool and the one-time
+    initialization. Cached instances are kept for the lifetime of the
+    process; an application only ever talks to a handful of databases, and
+    evicting a live inserter would leak its connection pools.
+
+    All keyword argument values must be hashable (they form the cache key),
+    so a dict-valued kwarg raises TypeError.
+
+    Args:
+        **kwargs: Keyword arguments forwarded to SignalInserter
+
+    Returns:
+        A cached SignalInserter instance for this configuration
+
+    Example:
+        from ac_core import get_inserter
+
+        inserter = get_inserter()  # same instance on every call
+        inserter.insert_single_signal(date.today(), 'AAPL', 'RSI', 0.6)
+    """
+    return _build_inserter(tuple(sorted(kwargs.items())))
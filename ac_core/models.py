@@ -4,14 +4,85 @@ Data models for AC Core library.
 This module defines the data structures used for signal insertion operations.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date, datetime
+import functools
 from typing import Dict, List, Optional, Any
+import numpy as np
 import pandas as pd
 import json
 
+try:
+    # Optional: orjson serializes metadata ~5-10x faster than stdlib json
+    import orjson
 
-@dataclass
+    def _dumps(obj: Any) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _dumps = json.dumps
+
+# Required columns for signal DataFrames
+REQUIRED_SIGNAL_COLUMNS = ('asof_date', 'ticker', 'signal_name', 'value')
+
+# Full signal_raw column order used for DataFrame construction
+SCHEMA_COLUMNS = ('asof_date', 'ticker', 'signal_name', 'value',
+                  'metadata', 'created_at')
+
+
+@functools.lru_cache(maxsize=32)
+def _validate_schema(columns: tuple, dtypes: tuple) -> tuple:
+    """
+    Validate the structural (column/dtype) part of a signal DataFrame.
+
+    Memoized on the (columns, dtypes) pair: when one CSV is streamed in many
+    chunks, every chunk after the first answers these checks from the cache
+    instead of re-inspecting the schema.
+
+    Args:
+        columns: Tuple of column names
+        dtypes: Tuple of corresponding dtypes
+
+    Returns:
+        Tuple of structural validation error messages (empty if valid)
+    """
+    errors = []
+    missing_columns = [col for col in REQUIRED_SIGNAL_COLUMNS if col not in columns]
+    if missing_columns:
+        errors.append(f"Missing required columns: {missing_columns}")
+        return tuple(errors)
+
+    dtype_of = dict(zip(columns, dtypes))
+    for col in ('ticker', 'signal_name'):
+        dtype = dtype_of[col]
+        # Categoricals carry their string values in the categories; accept
+        # them alongside plain string/object columns
+        if isinstance(dtype, pd.CategoricalDtype):
+            continue
+        if not (pd.api.types.is_string_dtype(dtype) or dtype == object):
+            errors.append(f"Column '{col}' must contain non-null strings")
+    if not pd.api.types.is_numeric_dtype(dtype_of['value']):
+        errors.append("Column 'value' must contain numeric values")
+    return tuple(errors)
+
+
+def _parse_metadata(raw: Any) -> Optional[Dict[str, Any]]:
+    """
+    Coerce one metadata cell to a dict or None.
+
+    Accepts dicts (passed through), JSON strings (decoded), and anything
+    else — including malformed JSON — which maps to None.
+    """
+    if isinstance(raw, dict):
+        return raw
+    if isinstance(raw, str):
+        try:
+            return json.loads(raw)
+        except json.JSONDecodeError:
+            return None
+    return None
+
+
+@dataclass(slots=True)
 class SignalRaw:
     """
     Represents raw signal data for a specific ticker and date.
@@ -42,12 +113,15 @@ class SignalRaw:
     value: float
     metadata: Optional[Dict[str, Any]] = None
     created_at: Optional[datetime] = None
+    # Lazily cached JSON encoding of metadata; filled by metadata_json()
+    _metadata_json: Optional[str] = field(
+        default=None, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         """Validate and set default values after initialization."""
         if self.created_at is None:
             self.created_at = datetime.now()
-        
+
         # Validate required fields
         if not self.ticker or not isinstance(self.ticker, str):
             raise ValueError("ticker must be a non-empty string")
@@ -58,6 +132,56 @@ class SignalRaw:
         if not isinstance(self.asof_date, date):
             raise ValueError("asof_date must be a date object")
 
+    @classmethod
+    def unchecked(cls, asof_date, ticker, signal_name, value,
+                  metadata=None, created_at=None) -> 'SignalRaw':
+        """
+        Build a SignalRaw without running __post_init__ validation.
+
+        Intended for trusted bulk paths (e.g. DataFrame conversion) where the
+        data has already been validated once: skips the per-instance type
+        checks and the datetime.now() call for a missing created_at, leaving
+        the timestamp to be filled at the database boundary.
+
+        Args:
+            asof_date: The date for which this signal is calculated
+            ticker: Stock ticker symbol
+            signal_name: Name of the signal
+            value: The signal value/score
+            metadata: Optional metadata dictionary
+            created_at: Optional creation timestamp (left as None if missing)
+
+        Returns:
+            SignalRaw instance with fields assigned verbatim
+        """
+        obj = cls.__new__(cls)
+        obj.asof_date = asof_date
+        obj.ticker = ticker
+        obj.signal_name = signal_name
+        obj.value = value
+        obj.metadata = metadata
+        obj.created_at = created_at
+        obj._metadata_json = None
+        return obj
+
+    def metadata_json(self) -> Optional[str]:
+        """
+        Return metadata encoded as JSON, caching the result.
+
+        Signals that flow through several inserts or conversions would
+        otherwise re-encode the same dict each time; the first call stores
+        the encoded string on the instance and later calls return it
+        directly. None metadata stays None (a SQL NULL downstream).
+
+        Returns:
+            JSON string for this signal's metadata, or None
+        """
+        j = self._metadata_json
+        if j is None and self.metadata is not None:
+            j = _dumps(self.metadata)
+            self._metadata_json = j
+        return j
+
 
 class DataFrameConverter:
     """
@@ -83,19 +207,39 @@ class DataFrameConverter:
             df = DataFrameConverter.signals_raw_to_dataframe(signals)
         """
         if not signals:
-            return pd.DataFrame(columns=['asof_date', 'ticker', 'signal_name', 'value', 'metadata', 'created_at'])
-        
-        data = []
-        for signal in signals:
-            data.append({
-                'asof_date': signal.asof_date,
-                'ticker': signal.ticker,
-                'signal_name': signal.signal_name,
-                'value': signal.value,
-                'metadata': json.dumps(signal.metadata) if signal.metadata else None,
-                'created_at': signal.created_at
-            })
-        return pd.DataFrame(data)
+            return pd.DataFrame(columns=list(SCHEMA_COLUMNS))
+
+        # Build one list per column (structure-of-arrays) instead of a dict
+        # per signal: skips per-row dict hashing and pandas type inference
+        n = len(signals)
+        dates = [None] * n
+        tickers = [None] * n
+        names = [None] * n
+        values = [0.0] * n
+        metadatas = [None] * n
+        createds = [None] * n
+        for i, signal in enumerate(signals):
+            dates[i] = signal.asof_date
+            tickers[i] = signal.ticker
+            names[i] = signal.signal_name
+            values[i] = signal.value
+            # Metadata stays a Python dict; JSON encoding happens only at the
+            # database boundary, so DataFrame round-trips skip a dumps+loads
+            # pair per row
+            metadatas[i] = signal.metadata
+            createds[i] = signal.created_at
+
+        # ticker/signal_name have very low cardinality (a handful of symbols
+        # and signal names repeated across dates); categoricals store each
+        # distinct string once plus small integer codes per row
+        return pd.DataFrame({
+            'asof_date': dates,
+            'ticker': pd.Categorical(tickers),
+            'signal_name': pd.Categorical(names),
+            'value': pd.array(values, dtype='float64'),
+            'metadata': metadatas,
+            'created_at': createds
+        }, copy=False)
     
     @staticmethod
     def dataframe_to_signals_raw(df: pd.DataFrame) -> List[SignalRaw]:
@@ -124,83 +268,168 @@ class DataFrameConverter:
         missing_columns = [col for col in required_columns if col not in df.columns]
         if missing_columns:
             raise ValueError(f"DataFrame missing required columns: {missing_columns}")
-        
+
+        if df.empty:
+            return []
+
+        # Only the cheap structural (column/dtype) check runs here: policy
+        # validation - null scans, duplicate keys - belongs to the insert
+        # entry points, which decide whether and how strictly to apply it.
+        # The structural check is what the per-row unchecked constructors
+        # rely on
+        structural_errors = _validate_schema(tuple(df.columns), tuple(df.dtypes))
+        if structural_errors:
+            raise ValueError(
+                f"Invalid DataFrame for signal conversion: {list(structural_errors)}")
+
+        n = len(df)
+
+        # Pull columns out once as plain Python lists: iterating lists avoids
+        # the per-row Series construction iterrows() would pay
+        dates = df['asof_date'].tolist()
+        tickers = df['ticker'].tolist()
+        names = df['signal_name'].tolist()
+        values = df['value'].tolist()
+
+        has_meta = 'metadata' in df.columns
+        if has_meta:
+            metas = df['metadata'].tolist()
+            meta_present = df['metadata'].notna().tolist()
+        has_created = 'created_at' in df.columns
+        if has_created:
+            createds = df['created_at'].tolist()
+            created_present = df['created_at'].notna().tolist()
+
         signals = []
-        for _, row in df.iterrows():
-            # Parse metadata if present
-            metadata = None
-            if 'metadata' in df.columns and pd.notna(row.get('metadata')):
-                try:
-                    if isinstance(row['metadata'], str):
-                        metadata = json.loads(row['metadata'])
-                    elif isinstance(row['metadata'], dict):
-                        metadata = row['metadata']
-                except (json.JSONDecodeError, TypeError):
-                    metadata = None
-            
-            # Parse created_at if present
-            created_at = row.get('created_at')
-            if pd.isna(created_at):
-                created_at = None
-            
-            signals.append(SignalRaw(
-                asof_date=row['asof_date'],
-                ticker=row['ticker'],
-                signal_name=row['signal_name'],
-                value=row['value'],
+        append = signals.append
+        parse_meta = _parse_metadata
+        for i in range(n):
+            metadata = (parse_meta(metas[i])
+                        if has_meta and meta_present[i] else None)
+            created_at = createds[i] if has_created and created_present[i] else None
+
+            append(SignalRaw.unchecked(
+                asof_date=dates[i],
+                ticker=tickers[i],
+                signal_name=names[i],
+                value=values[i],
                 metadata=metadata,
                 created_at=created_at
             ))
         return signals
     
     @staticmethod
-    def validate_dataframe(df: pd.DataFrame) -> List[str]:
+    def dataframe_to_columns(df: pd.DataFrame) -> Dict[str, Any]:
+        """
+        Extract signal columns from a DataFrame as raw arrays.
+
+        This is the bulk-insertion counterpart of dataframe_to_signals_raw:
+        instead of materializing one SignalRaw object per row, it returns one
+        array per column so the database layer can zip them into row tuples at
+        C level. Missing metadata/created_at values come back as None, and
+        datetime64 asof_date columns are exposed as their per-element
+        timestamps (which the drivers adapt directly).
+
+        Args:
+            df: DataFrame with columns: asof_date, ticker, signal_name, value,
+                metadata (optional), created_at (optional)
+
+        Returns:
+            Dict mapping column name to a numpy array of values
+
+        Raises:
+            ValueError: If required columns are missing
+
+        Example:
+            cols = DataFrameConverter.dataframe_to_columns(df)
+            rows = zip(cols['asof_date'], cols['ticker'],
+                       cols['signal_name'], cols['value'],
+                       cols['metadata'], cols['created_at'])
+        """
+        required_columns = ['asof_date', 'ticker', 'signal_name', 'value']
+        missing_columns = [col for col in required_columns if col not in df.columns]
+        if missing_columns:
+            raise ValueError(f"DataFrame missing required columns: {missing_columns}")
+
+        n = len(df)
+        columns = {
+            'asof_date': df['asof_date'].to_numpy(dtype=object),
+            'ticker': df['ticker'].to_numpy(dtype=object),
+            'signal_name': df['signal_name'].to_numpy(dtype=object),
+            'value': df['value'].to_numpy(dtype='float64'),
+        }
+
+        for optional in ('metadata', 'created_at'):
+            if optional in df.columns:
+                # Mask NaN/NaT to None so drivers see proper SQL NULLs
+                values = df[optional].to_numpy(dtype=object)
+                mask = df[optional].notna().to_numpy()
+                columns[optional] = np.where(mask, values, None)
+            else:
+                columns[optional] = np.full(n, None, dtype=object)
+        return columns
+
+    @staticmethod
+    def validate_dataframe(df: pd.DataFrame,
+                           sample_rows: Optional[int] = None) -> List[str]:
         """
         Validate DataFrame structure and data for signal insertion.
-        
+
         Args:
             df: DataFrame to validate
-            
+            sample_rows: When set, run the per-value checks (date parsing of
+                object columns, null scans) on a random sample of this many
+                rows instead of the full frame. Schema checks and the
+                duplicate-key check always cover everything: a missed
+                duplicate would abort the whole upsert statement, so it is
+                not worth sampling away.
+
         Returns:
             List of validation error messages (empty if valid)
-            
+
         Example:
             errors = DataFrameConverter.validate_dataframe(df)
             if errors:
                 print("Validation errors:", errors)
         """
-        errors = []
-        
-        # Check required columns
-        required_columns = ['asof_date', 'ticker', 'signal_name', 'value']
-        missing_columns = [col for col in required_columns if col not in df.columns]
-        if missing_columns:
-            errors.append(f"Missing required columns: {missing_columns}")
-        
+        # Structural checks are memoized on the schema, so repeated chunks of
+        # the same source only pay them once
+        errors = list(_validate_schema(tuple(df.columns), tuple(df.dtypes)))
+
         if df.empty:
             errors.append("DataFrame is empty")
             return errors
-        
-        # Check data types and values
-        for col in required_columns:
-            if col in df.columns:
-                if col == 'asof_date':
-                    if not pd.api.types.is_datetime64_any_dtype(df[col]) and not all(isinstance(x, date) for x in df[col]):
-                        errors.append(f"Column '{col}' must contain date objects")
-                elif col == 'ticker':
-                    if not df[col].dtype == 'object' or df[col].isna().any():
-                        errors.append(f"Column '{col}' must contain non-null strings")
-                elif col == 'signal_name':
-                    if not df[col].dtype == 'object' or df[col].isna().any():
-                        errors.append(f"Column '{col}' must contain non-null strings")
-                elif col == 'value':
-                    if not pd.api.types.is_numeric_dtype(df[col]):
-                        errors.append(f"Column '{col}' must contain numeric values")
-        
+
+        # Any structural problem (missing columns, wrong dtypes) makes the
+        # per-value scans below meaningless noise at O(n) cost; report the
+        # structural errors alone and stop
+        if errors:
+            return errors
+
+        # Data-dependent checks below traverse actual values; a sample keeps
+        # them O(sample_rows) on million-row frames
+        sample = df
+        if sample_rows is not None and len(df) > sample_rows:
+            sample = df.sample(sample_rows, random_state=0)
+
+        # Dtype check first; object columns must hold real date/datetime
+        # objects. Coercion with pd.to_datetime would also accept date
+        # *strings*, which nothing downstream converts - the write path
+        # needs values with .toordinal()
+        is_datelike = pd.api.types.is_datetime64_any_dtype(df['asof_date'])
+        if not is_datelike and df['asof_date'].dtype == 'object':
+            is_datelike = all(isinstance(x, date) for x in sample['asof_date'])
+        if not is_datelike:
+            errors.append("Column 'asof_date' must contain date objects")
+
+        for col in ('ticker', 'signal_name'):
+            message = f"Column '{col}' must contain non-null strings"
+            if message not in errors and sample[col].isna().any():
+                errors.append(message)
+
         # Check for duplicate combinations of asof_date, ticker, signal_name
-        if all(col in df.columns for col in ['asof_date', 'ticker', 'signal_name']):
-            duplicates = df.duplicated(subset=['asof_date', 'ticker', 'signal_name'])
-            if duplicates.any():
-                errors.append(f"Found {duplicates.sum()} duplicate signal records (same asof_date, ticker, signal_name)")
-        
+        duplicates = df.duplicated(subset=['asof_date', 'ticker', 'signal_name'])
+        if duplicates.any():
+            errors.append(f"Found {duplicates.sum()} duplicate signal records (same asof_date, ticker, signal_name)")
+
         return errors
@@ -5,19 +5,51 @@ This module provides the main SignalInserter class that offers a high-level
 interface for inserting signals into the Supabase database from various sources.
 """
 
+import asyncio
 import os
 import logging
+import time
 from datetime import date, datetime
 from typing import List, Dict, Optional, Any, Union
 from pathlib import Path
+import numpy as np
 import pandas as pd
 
-from .models import SignalRaw, DataFrameConverter
+from .models import SignalRaw, DataFrameConverter, _dumps
 from .database_manager import DatabaseManager
 
+try:
+    # Optional: asyncpg enables concurrent batch uploads on an async pool
+    import asyncpg
+except ImportError:
+    asyncpg = None
+
+try:
+    # Optional: pyarrow's CSV reader parses blocks on multiple threads
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pacsv = None
+
 logger = logging.getLogger(__name__)
 
 
+def _pack_rows(batch: List[SignalRaw], now: datetime) -> List[tuple]:
+    """
+    Materialize driver-ready row tuples from a batch of signals.
+
+    Runs in a worker thread on the async path so the tuple construction
+    (pure-Python, GIL-bound) does not stall the event loop while the
+    transport is flushing other batches.
+    """
+    return [
+        (s.asof_date, s.ticker, s.signal_name, s.value,
+         s.metadata_json(), s.created_at or now)
+        for s in batch
+    ]
+
+
 class SignalInserter:
     """
     High-level interface for inserting signals into the Alpha Crucible Quant database.
@@ -56,7 +88,9 @@ class SignalInserter:
     def __init__(self, database_url: Optional[str] = None, 
                  host: Optional[str] = None, port: Optional[int] = None,
                  user: Optional[str] = None, password: Optional[str] = None,
-                 database: Optional[str] = None, auto_create_table: bool = True):
+                 database: Optional[str] = None, auto_create_table: bool = True,
+                 reinit_sequence: bool = False,
+                 use_server_prepared: bool = False):
         """
         Initialize the SignalInserter.
         
@@ -68,22 +102,162 @@ class SignalInserter:
             password: Database password (fallback if no URL)
             database: Database name (fallback if no URL)
             auto_create_table: Whether to automatically create signal_raw table if missing
-        
+            reinit_sequence: Whether to reset the id sequence during setup.
+                Only needed after migrations that load rows with explicit ids;
+                upserts never touch the sequence, so this defaults to False.
+            use_server_prepared: Allow server-side prepared statements for
+                small batches. Leave False behind Supabase's transaction
+                pooler; enable only on direct connections.
+
         Note:
             If no connection parameters are provided, the inserter will use
             environment variables (DATABASE_URL, DB_HOST, etc.).
         """
         self.db_manager = DatabaseManager(
             database_url=database_url,
-            host=host, port=port, user=user, password=password, database=database
+            host=host, port=port, user=user, password=password, database=database,
+            use_server_prepared=use_server_prepared
         )
         self.auto_create_table = auto_create_table
-        
+        self.reinit_sequence = reinit_sequence
+        self._async_pool = None
+        self._initialized = False
+        self._tuned_batch_size = None
+
         logger.info("SignalInserter initialized")
+
+    @classmethod
+    def for_validation_only(cls) -> 'SignalInserter':
+        """
+        Build an inserter that validates data without touching the database.
+
+        Skips the DatabaseManager wiring entirely, so no connection pool is
+        configured and nothing is dialed. Useful for exercising validation
+        (e.g. DataFrameConverter.validate_dataframe through
+        insert_from_dataframe's error paths) in scripts and examples that
+        have no database available. Any insert attempt will fail cleanly.
+
+        Returns:
+            SignalInserter with no database manager attached
+
+        Example:
+            inserter = SignalInserter.for_validation_only()
+            result = inserter.insert_from_dataframe(bad_df)
+            print(result['errors'])
+        """
+        obj = cls.__new__(cls)
+        obj.db_manager = None
+        obj.auto_create_table = False
+        obj.reinit_sequence = False
+        obj._async_pool = None
+        obj._initialized = False
+        obj._tuned_batch_size = None
+        return obj
+
+    def _ensure_initialized(self) -> bool:
+        """
+        Run one-time database initialization, skipping it on later calls.
+
+        Connection checks and table creation are idempotent but each costs a
+        server round-trip; doing them on every insert dominates latency for
+        callers that stream many small batches. They run once here, gated by
+        a flag. The id sequence is left alone: all insert paths upsert via
+        ON CONFLICT, so id collisions cannot happen and resetting the
+        sequence would only serialize concurrent writers.
+
+        Returns:
+            True if the database is ready for inserts, False otherwise
+        """
+        if self._initialized:
+            return True
+
+        if self.db_manager is None:
+            logger.error("No database manager configured (validation-only inserter)")
+            return False
+
+        if not self.db_manager.ensure_connection():
+            logger.error("Failed to connect to database")
+            return False
+
+        if self.auto_create_table:
+            if not self.db_manager.create_signal_raw_table():
+                logger.error("Failed to create signal_raw table")
+                return False
+
+        if self.reinit_sequence:
+            # Migration escape hatch: realign the sequence after bulk loads
+            # that supplied explicit ids
+            self.db_manager.reset_sequence()
+
+        self._initialized = True
+        return True
+
+    def force_reinit(self):
+        """
+        Clear the initialization flag so the next insert re-runs setup.
+
+        Example:
+            inserter.force_reinit()  # e.g. after dropping the table in tests
+        """
+        self._initialized = False
     
-    def insert_from_dataframe(self, df: pd.DataFrame, 
-                            validate: bool = True,
-                            batch_size: int = 1000) -> Dict[str, Any]:
+    # Candidate batch sizes probed by the autotuner; inputs smaller than the
+    # minimum are not worth the probing overhead
+    _AUTOTUNE_CANDIDATES = (256, 1024, 4096, 16384)
+    _AUTOTUNE_MIN_ROWS = 10_000
+
+    def _autotune_batch_size(self, column_arrays: tuple, n_rows: int) -> tuple:
+        """
+        Probe candidate batch sizes against the live database.
+
+        Every candidate stores the same number of rows in one
+        store_signal_rows call with batch_size=size, so the fixed per-call
+        cost (temp table DDL + merge) is identical across probes and the
+        timing isolates the COPY buffer size - the parameter actually being
+        tuned. The best rows/sec winner is locked into
+        self._tuned_batch_size for the rest of the session; probe rows are
+        real inserts, so nothing is wasted.
+
+        Args:
+            column_arrays: Per-column value arrays in signal_raw order
+            n_rows: Total number of rows available in the arrays
+
+        Returns:
+            (rows_consumed, rows_inserted) covering the probe batches
+        """
+        probe_rows = min(n_rows // len(self._AUTOTUNE_CANDIDATES),
+                         self._AUTOTUNE_CANDIDATES[-1])
+        best_size = None
+        best_rate = 0.0
+        offset = 0
+        inserted = 0
+        for size in self._AUTOTUNE_CANDIDATES:
+            if size > probe_rows:
+                # A buffer larger than the probe degenerates to one buffer
+                # and would be indistinguishable from a smaller candidate
+                break
+            probe = zip(*(c[offset:offset + probe_rows] for c in column_arrays))
+            start = time.perf_counter()
+            inserted += self.db_manager.store_signal_rows(probe, batch_size=size)
+            elapsed = time.perf_counter() - start
+            offset += probe_rows
+            rate = probe_rows / elapsed if elapsed > 0 else float('inf')
+            if rate > best_rate:
+                best_rate = rate
+                best_size = size
+        if best_size is not None:
+            self._tuned_batch_size = best_size
+            logger.info("Autotuned batch_size to %d (%.0f rows/sec)",
+                        best_size, best_rate)
+        return offset, inserted
+
+    # Rows sampled for per-value validation when validate=True; pass
+    # validate='strict' for a full scan
+    _VALIDATE_SAMPLE_ROWS = 100
+
+    def insert_from_dataframe(self, df: pd.DataFrame,
+                            validate: Union[bool, str] = True,
+                            batch_size: Optional[int] = None) -> Dict[str, Any]:
         """
         Insert signals from a pandas DataFrame.
         
@@ -93,9 +267,13 @@ class SignalInserter:
         
         Args:
             df: DataFrame with signal data
-            validate: Whether to validate DataFrame structure before insertion
-            batch_size: Number of records to process in each batch
-            
+            validate: True runs schema checks plus per-value checks on a
+                100-row sample; 'strict' scans every value; False skips
+                validation entirely
+            batch_size: Number of records to process in each batch. When None,
+                uses the session's autotuned size (measured on the first large
+                insert) and falls back to 1000
+
         Returns:
             Dictionary with insertion results:
             {
@@ -136,57 +314,88 @@ class SignalInserter:
         }
         
         try:
-            # Validate DataFrame if requested
+            # Validate DataFrame if requested; the default samples per-value
+            # checks so validation stays O(1) in the row count
             if validate:
-                validation_errors = DataFrameConverter.validate_dataframe(df)
+                sample_rows = (None if validate == 'strict'
+                               else self._VALIDATE_SAMPLE_ROWS)
+                validation_errors = DataFrameConverter.validate_dataframe(
+                    df, sample_rows=sample_rows)
                 if validation_errors:
                     result['errors'].extend(validation_errors)
                     logger.error(f"DataFrame validation failed: {validation_errors}")
                     return result
             
-            # Ensure database connection
-            if not self.db_manager.ensure_connection():
-                result['errors'].append("Failed to connect to database")
+            # One-time connection/table setup
+            if not self._ensure_initialized():
+                result['errors'].append("Failed to initialize database connection")
                 return result
-            
-            # Create table if needed
-            if self.auto_create_table:
-                if not self.db_manager.create_signal_raw_table():
-                    result['errors'].append("Failed to create signal_raw table")
-                    return result
-                
-                # Reset sequence to prevent ID conflicts
-                self.db_manager.reset_sequence()
-            
-            # Convert DataFrame to SignalRaw objects
+
+            # Extract raw column arrays; zipping them into row tuples is a
+            # C-level iteration, with no per-row SignalRaw materialization
             try:
-                signals = DataFrameConverter.dataframe_to_signals_raw(df)
+                cols = DataFrameConverter.dataframe_to_columns(df)
             except Exception as e:
                 result['errors'].append(f"Failed to convert DataFrame to signals: {str(e)}")
                 return result
-            
-            result['records_processed'] = len(signals)
-            
-            # Insert signals in batches
+
+            n_signals = len(df)
+            result['records_processed'] = n_signals
+
+            # Encode the metadata column to JSON in one pass over the array
+            # (orjson when available) so the row normalization downstream
+            # only sees pass-through strings
+            metadata = np.fromiter(
+                (_dumps(m) if isinstance(m, dict) else m
+                 for m in cols['metadata']),
+                dtype=object, count=n_signals)
+
+            # Rows are handed over as a zip generator over numpy column
+            # slices; store_signal_rows materializes them into one normalized
+            # list (its COPY->VALUES retry chain must re-iterate), so peak
+            # memory is one tuple list for the handed-over rows, not an extra
+            # copy per retry tier
+            column_arrays = (cols['asof_date'], cols['ticker'],
+                             cols['signal_name'], cols['value'],
+                             metadata, cols['created_at'])
+
+            # Insert rows in batches
             total_inserted = 0
-            for i in range(0, len(signals), batch_size):
-                batch = signals[i:i + batch_size]
+            start_index = 0
+            if batch_size is None:
+                if (self._tuned_batch_size is None
+                        and n_signals >= self._AUTOTUNE_MIN_ROWS):
+                    try:
+                        start_index, probe_inserted = self._autotune_batch_size(
+                            column_arrays, n_signals)
+                        total_inserted += probe_inserted
+                    except Exception as e:
+                        error_msg = f"Failed to insert probe batch: {str(e)}"
+                        result['errors'].append(error_msg)
+                        logger.error(error_msg)
+                batch_size = self._tuned_batch_size or 1000
+
+            # Single handoff: the database layer batches internally (COPY
+            # buffers of batch_size rows merged in one transaction), so there
+            # is no Python-side slicing loop with a round-trip per batch
+            if start_index < n_signals:
+                batch = zip(*(c[start_index:] for c in column_arrays))
                 try:
-                    inserted_count = self.db_manager.store_signals_raw(batch)
-                    total_inserted += inserted_count
-                    logger.info(f"Inserted batch {i//batch_size + 1}: {inserted_count} signals")
+                    total_inserted += self.db_manager.store_signal_rows(
+                        batch, batch_size=batch_size)
                 except Exception as e:
-                    error_msg = f"Failed to insert batch {i//batch_size + 1}: {str(e)}"
+                    error_msg = f"Failed to insert signals: {str(e)}"
                     result['errors'].append(error_msg)
                     logger.error(error_msg)
-            
+
             result['records_inserted'] = total_inserted
             result['success'] = len(result['errors']) == 0
-            
+
             if result['success']:
-                logger.info(f"Successfully inserted {total_inserted} signals from DataFrame")
+                logger.info("Inserted %d signals from DataFrame", total_inserted)
             else:
-                logger.warning(f"Partial success: {total_inserted}/{len(signals)} signals inserted")
+                logger.warning("Partial success: %d/%d signals inserted",
+                               total_inserted, n_signals)
             
         except Exception as e:
             result['errors'].append(f"Unexpected error during insertion: {str(e)}")
@@ -194,9 +403,224 @@ class SignalInserter:
         
         return result
     
-    def insert_from_csv(self, csv_path: Union[str, Path], 
+    # Batches above this size are staged with COPY instead of executemany
+    _ASYNC_COPY_THRESHOLD = 500
+
+    _ASYNC_STAGING_DDL = """
+    CREATE TEMP TABLE tmp_signal_async (
+        asof_date DATE,
+        ticker VARCHAR(20),
+        signal_name VARCHAR(100),
+        value FLOAT,
+        metadata JSONB,
+        created_at TIMESTAMP
+    ) ON COMMIT DROP
+    """
+
+    # DISTINCT ON collapses in-batch duplicate keys (last staged row wins);
+    # ON CONFLICT cannot update the same row twice in one statement
+    _ASYNC_MERGE_SQL = """
+    INSERT INTO signal_raw (asof_date, ticker, signal_name, value, metadata, created_at)
+    SELECT DISTINCT ON (asof_date, ticker, signal_name)
+        asof_date, ticker, signal_name, value, metadata, created_at
+    FROM tmp_signal_async
+    ORDER BY asof_date, ticker, signal_name, ctid DESC
+    ON CONFLICT (asof_date, ticker, signal_name) DO UPDATE SET
+        value = EXCLUDED.value,
+        metadata = EXCLUDED.metadata,
+        created_at = EXCLUDED.created_at
+    """
+
+    # asyncpg-style upsert with positional parameters
+    _ASYNC_UPSERT_SQL = """
+    INSERT INTO signal_raw (asof_date, ticker, signal_name, value, metadata, created_at)
+    VALUES ($1, $2, $3, $4, $5, $6)
+    ON CONFLICT (asof_date, ticker, signal_name) DO UPDATE SET
+        value = EXCLUDED.value,
+        metadata = EXCLUDED.metadata,
+        created_at = EXCLUDED.created_at
+    """
+
+    async def _get_async_pool(self):
+        """Lazily create and cache the asyncpg connection pool."""
+        if asyncpg is None:
+            raise ImportError(
+                "async insertion requires the optional asyncpg package")
+        if self.db_manager is None or not self.db_manager.database_url:
+            # Without a URL asyncpg would silently fall back to PG*
+            # environment variables and could target a different database
+            # than the sync paths
+            raise ValueError("async insertion requires a database_url configuration")
+        if self._async_pool is None:
+            self._async_pool = await asyncpg.create_pool(
+                self.db_manager.database_url,
+                min_size=10,
+                max_size=50,
+                max_inactive_connection_lifetime=300,
+                # Supabase's transaction pooler routes each statement to a
+                # different backend, so asyncpg's implicit prepared-statement
+                # cache would raise "prepared statement does not exist"
+                statement_cache_size=0,
+            )
+        return self._async_pool
+
+    async def async_insert_from_dataframe(self, df: pd.DataFrame,
+                                          validate: bool = True,
+                                          batch_size: int = 1000,
+                                          concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Insert signals from a DataFrame using concurrent async batches.
+
+        Insertion is network-bound, so total latency of the serial path is
+        batches x round-trip time. This coroutine partitions the signals into
+        batches and uploads them concurrently over an asyncpg connection pool,
+        bounded by a semaphore so the server sees at most `concurrency`
+        requests in flight.
+
+        Requires the optional asyncpg package and a database_url-style
+        configuration.
+
+        Args:
+            df: DataFrame with signal data
+            validate: Whether to validate DataFrame structure before insertion
+            batch_size: Number of records per upload batch
+            concurrency: Maximum number of batches in flight at once
+
+        Returns:
+            Dictionary with insertion results (same format as
+            insert_from_dataframe)
+
+        Example:
+            result = asyncio.run(inserter.async_insert_from_dataframe(df))
+        """
+        result = {
+            'success': False,
+            'records_processed': 0,
+            'records_inserted': 0,
+            'errors': [],
+            'warnings': []
+        }
+
+        if validate:
+            validation_errors = DataFrameConverter.validate_dataframe(df)
+            if validation_errors:
+                result['errors'].extend(validation_errors)
+                logger.error(f"DataFrame validation failed: {validation_errors}")
+                return result
+
+        # The DataFrame conversion is CPU-bound; run it in a worker thread so
+        # the event loop stays free to service in-flight uploads
+        loop = asyncio.get_running_loop()
+        try:
+            signals = await loop.run_in_executor(
+                None, DataFrameConverter.dataframe_to_signals_raw, df)
+        except Exception as e:
+            result['errors'].append(f"Failed to convert DataFrame to signals: {str(e)}")
+            return result
+
+        result['records_processed'] = len(signals)
+
+        try:
+            pool = await self._get_async_pool()
+        except Exception as e:
+            result['errors'].append(f"Failed to connect to database: {str(e)}")
+            return result
+
+        semaphore = asyncio.Semaphore(concurrency)
+        now = datetime.now()
+
+        async def _upload(batch: List[SignalRaw]) -> int:
+            rows = await loop.run_in_executor(None, _pack_rows, batch, now)
+            async with semaphore:
+                async with pool.acquire() as con:
+                    if len(rows) > self._ASYNC_COPY_THRESHOLD:
+                        # COPY into a staging table and merge in one statement:
+                        # one streamed write instead of per-row parse/plan
+                        async with con.transaction():
+                            await con.execute(self._ASYNC_STAGING_DDL)
+                            await con.copy_records_to_table(
+                                'tmp_signal_async', records=rows,
+                                columns=['asof_date', 'ticker', 'signal_name',
+                                         'value', 'metadata', 'created_at'])
+                            await con.execute(self._ASYNC_MERGE_SQL)
+                    else:
+                        await con.executemany(self._ASYNC_UPSERT_SQL, rows)
+            return len(rows)
+
+        tasks = [
+            _upload(signals[i:i + batch_size])
+            for i in range(0, len(signals), batch_size)
+        ]
+        outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+        total_inserted = 0
+        for i, outcome in enumerate(outcomes):
+            if isinstance(outcome, BaseException):
+                error_msg = f"Failed to insert batch {i + 1}: {outcome}"
+                result['errors'].append(error_msg)
+                logger.error(error_msg)
+            else:
+                total_inserted += outcome
+
+        result['records_inserted'] = total_inserted
+        result['success'] = len(result['errors']) == 0
+        return result
+
+    def insert_from_dataframe_concurrent(self, df: pd.DataFrame,
+                                         validate: bool = True,
+                                         batch_size: int = 1000,
+                                         concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around async_insert_from_dataframe.
+
+        Args:
+            df: DataFrame with signal data
+            validate: Whether to validate DataFrame structure before insertion
+            batch_size: Number of records per upload batch
+            concurrency: Maximum number of batches in flight at once
+
+        Returns:
+            Dictionary with insertion results (same format as
+            insert_from_dataframe)
+        """
+        return asyncio.run(self.async_insert_from_dataframe(
+            df, validate=validate, batch_size=batch_size, concurrency=concurrency))
+
+    async def aclose(self):
+        """Close the async connection pool if one was created."""
+        if self._async_pool is not None:
+            await self._async_pool.close()
+            self._async_pool = None
+
+    # Files below this size are loaded in one read; larger ones are streamed
+    _CSV_CHUNK_THRESHOLD_BYTES = 10 * 1024 * 1024
+
+    @staticmethod
+    def _convert_asof_date(df: pd.DataFrame, result: Dict[str, Any]) -> bool:
+        """
+        Coerce the asof_date column to datetime64 in place.
+
+        The column deliberately stays datetime64 rather than being converted
+        with .dt.date: that conversion materializes one Python date object per
+        row, while datetime64 keeps the values in a contiguous numeric buffer
+        until the database boundary (where the drivers adapt timestamps to
+        DATE directly). Columns already parsed by parse_dates are left
+        untouched.
+
+        Appends to result['errors'] and returns False if parsing fails.
+        """
+        if 'asof_date' in df.columns and \
+                not pd.api.types.is_datetime64_any_dtype(df['asof_date']):
+            try:
+                df['asof_date'] = pd.to_datetime(df['asof_date'])
+            except Exception as e:
+                result['errors'].append(f"Failed to parse asof_date column: {str(e)}")
+                return False
+        return True
+
+    def insert_from_csv(self, csv_path: Union[str, Path],
                        validate: bool = True,
-                       batch_size: int = 1000,
+                       batch_size: Optional[int] = None,
                        **pandas_kwargs) -> Dict[str, Any]:
         """
         Insert signals from a CSV file.
@@ -208,7 +632,8 @@ class SignalInserter:
         Args:
             csv_path: Path to the CSV file
             validate: Whether to validate DataFrame structure before insertion
-            batch_size: Number of records to process in each batch
+            batch_size: Number of records to process in each batch (None uses
+                the session's autotuned size, falling back to 1000)
             **pandas_kwargs: Additional arguments passed to pd.read_csv()
             
         Returns:
@@ -264,30 +689,74 @@ class SignalInserter:
                 'parse_dates': ['asof_date'],
             }
             default_kwargs.update(pandas_kwargs)
-            
-            # Read CSV file
+
+            # Small files are read in one shot; larger ones stream through
+            # chunks so parsing overlaps insertion and peak memory stays at
+            # one chunk instead of the whole file
+            if csv_path.stat().st_size < self._CSV_CHUNK_THRESHOLD_BYTES:
+                df = None
+                if pa is not None and not pandas_kwargs:
+                    # pyarrow's engine parses columns (dates included) in
+                    # multithreaded C instead of the per-row Python callbacks
+                    # of the legacy date-parsing path
+                    try:
+                        df = pd.read_csv(csv_path, engine='pyarrow', **default_kwargs)
+                    except Exception as e:
+                        logger.debug("pyarrow CSV engine failed, falling back: %s", e)
+                if df is None:
+                    try:
+                        df = pd.read_csv(csv_path, **default_kwargs)
+                    except Exception as e:
+                        result['errors'].append(f"Failed to read CSV file: {str(e)}")
+                        return result
+                logger.info("Read %d records from CSV file: %s", len(df), csv_path)
+
+                # Check if DataFrame is empty
+                if df.empty:
+                    result['errors'].append("CSV file contains no data")
+                    return result
+
+                if not self._convert_asof_date(df, result):
+                    return result
+
+                # Insert using DataFrame method
+                return self.insert_from_dataframe(df, validate=validate, batch_size=batch_size)
+
+            # Prefer pyarrow's multi-threaded CSV reader when available and no
+            # custom pandas options were requested
+            if pacsv is not None and not pandas_kwargs:
+                return self._insert_from_csv_arrow(csv_path, validate, batch_size, result)
+
+            default_kwargs.setdefault('chunksize', max(batch_size or 1000, 100_000))
+            default_kwargs.setdefault('low_memory', False)
+            default_kwargs.setdefault('cache_dates', True)
+
             try:
-                df = pd.read_csv(csv_path, **default_kwargs)
-                logger.info(f"Read {len(df)} records from CSV file: {csv_path}")
+                reader = pd.read_csv(csv_path, **default_kwargs)
             except Exception as e:
                 result['errors'].append(f"Failed to read CSV file: {str(e)}")
                 return result
-            
-            # Check if DataFrame is empty
-            if df.empty:
+
+            n_chunks = 0
+            for chunk in reader:
+                n_chunks += 1
+                if not self._convert_asof_date(chunk, result):
+                    return result
+                chunk_result = self.insert_from_dataframe(
+                    chunk, validate=validate, batch_size=batch_size)
+                result['records_processed'] += chunk_result['records_processed']
+                result['records_inserted'] += chunk_result['records_inserted']
+                result['errors'].extend(chunk_result['errors'])
+                result['warnings'].extend(chunk_result['warnings'])
+
+            if n_chunks == 0:
                 result['errors'].append("CSV file contains no data")
                 return result
-            
-            # Convert date column if it's not already datetime
-            if 'asof_date' in df.columns:
-                try:
-                    df['asof_date'] = pd.to_datetime(df['asof_date']).dt.date
-                except Exception as e:
-                    result['errors'].append(f"Failed to parse asof_date column: {str(e)}")
-                    return result
-            
-            # Insert using DataFrame method
-            return self.insert_from_dataframe(df, validate=validate, batch_size=batch_size)
+
+            result['success'] = len(result['errors']) == 0
+            logger.info("Inserted %d signals from %d CSV chunks: %s",
+                        result['records_inserted'], n_chunks, csv_path)
+            return result
             
         except Exception as e:
             result['errors'].append(f"Unexpected error reading CSV file: {str(e)}")
@@ -295,7 +764,184 @@ class SignalInserter:
         
         return result
     
-    def insert_single_signal(self, asof_date: date, ticker: str, signal_name: str, 
+    def _insert_from_csv_arrow(self, csv_path: Path, validate: bool,
+                               batch_size: int,
+                               result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Stream a CSV file through pyarrow's multi-threaded reader.
+
+        Record batches are parsed in parallel worker threads into columnar
+        buffers, converted to DataFrames, and inserted one batch at a time.
+        asof_date is read directly as date32, so no per-element datetime
+        conversion is needed afterwards.
+
+        Args:
+            csv_path: Path to the CSV file
+            validate: Whether to validate each batch before insertion
+            batch_size: Number of records to process in each insert batch
+            result: Result dictionary to accumulate into
+
+        Returns:
+            The accumulated result dictionary
+        """
+        read_options = pacsv.ReadOptions(block_size=8 << 20, use_threads=True)
+        convert_options = pacsv.ConvertOptions(column_types={
+            'asof_date': pa.date32(),
+            'value': pa.float64(),
+        })
+
+        try:
+            n_batches = 0
+            with pacsv.open_csv(str(csv_path), read_options=read_options,
+                                convert_options=convert_options) as reader:
+                for batch in reader:
+                    n_batches += 1
+                    df = batch.to_pandas()
+                    chunk_result = self.insert_from_dataframe(
+                        df, validate=validate, batch_size=batch_size)
+                    result['records_processed'] += chunk_result['records_processed']
+                    result['records_inserted'] += chunk_result['records_inserted']
+                    result['errors'].extend(chunk_result['errors'])
+                    result['warnings'].extend(chunk_result['warnings'])
+        except Exception as e:
+            result['errors'].append(f"Failed to read CSV file: {str(e)}")
+            return result
+
+        if n_batches == 0:
+            result['errors'].append("CSV file contains no data")
+            return result
+
+        result['success'] = len(result['errors']) == 0
+        logger.info("Inserted %d signals from %d Arrow CSV batches: %s",
+                    result['records_inserted'], n_batches, csv_path)
+        return result
+
+    async def async_insert_from_csv(self, csv_path: Union[str, Path],
+                                    validate: bool = True,
+                                    batch_size: int = 1000,
+                                    concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Insert signals from a CSV file, overlapping parsing with uploads.
+
+        The serial CSV path alternates between reading a chunk and inserting
+        it, so total time is the sum of disk and network work. Here a producer
+        task parses the next chunk in a worker thread while the consumer
+        uploads the current one through the async pool, bounded by a
+        two-element queue so at most one chunk is buffered ahead. Throughput
+        becomes limited by the slower of the two stages instead of their sum.
+
+        Requires the optional asyncpg package and a database_url-style
+        configuration.
+
+        Args:
+            csv_path: Path to the CSV file
+            validate: Whether to validate each chunk before insertion
+            batch_size: Number of records per upload batch
+            concurrency: Maximum number of batches in flight at once
+
+        Returns:
+            Dictionary with insertion results (same format as
+            insert_from_dataframe)
+
+        Example:
+            result = asyncio.run(inserter.async_insert_from_csv('signals.csv'))
+        """
+        result = {
+            'success': False,
+            'records_processed': 0,
+            'records_inserted': 0,
+            'errors': [],
+            'warnings': []
+        }
+
+        csv_path = Path(csv_path)
+        if not csv_path.exists():
+            result['errors'].append(f"CSV file not found: {csv_path}")
+            return result
+        if csv_path.stat().st_size == 0:
+            result['errors'].append(f"CSV file is empty: {csv_path}")
+            return result
+
+        try:
+            reader = pd.read_csv(csv_path, parse_dates=['asof_date'],
+                                 chunksize=max(batch_size, 100_000),
+                                 low_memory=False, cache_dates=True)
+        except Exception as e:
+            result['errors'].append(f"Failed to read CSV file: {str(e)}")
+            return result
+
+        loop = asyncio.get_running_loop()
+        # maxsize=2 keeps exactly one chunk parsed ahead of the upload;
+        # deeper prefetch would only grow peak memory
+        queue: asyncio.Queue = asyncio.Queue(maxsize=2)
+
+        async def _producer():
+            # A mid-stream parse error (e.g. malformed row in a later chunk)
+            # must still reach the consumer: enqueue the exception itself as
+            # the terminator so queue.get() can never block forever
+            try:
+                while True:
+                    chunk = await loop.run_in_executor(None, next, reader, None)
+                    await queue.put(chunk)
+                    if chunk is None:
+                        return
+            except BaseException as e:
+                await queue.put(e)
+
+        producer = asyncio.create_task(_producer())
+        n_chunks = 0
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                if isinstance(chunk, BaseException):
+                    result['errors'].append(f"Failed to read CSV file: {chunk}")
+                    break
+                n_chunks += 1
+                if not self._convert_asof_date(chunk, result):
+                    break
+                chunk_result = await self.async_insert_from_dataframe(
+                    chunk, validate=validate, batch_size=batch_size,
+                    concurrency=concurrency)
+                result['records_processed'] += chunk_result['records_processed']
+                result['records_inserted'] += chunk_result['records_inserted']
+                result['errors'].extend(chunk_result['errors'])
+                result['warnings'].extend(chunk_result['warnings'])
+        finally:
+            producer.cancel()
+
+        if n_chunks == 0:
+            result['errors'].append("CSV file contains no data")
+            return result
+
+        result['success'] = len(result['errors']) == 0
+        logger.info("Inserted %d signals from %d pipelined CSV chunks: %s",
+                    result['records_inserted'], n_chunks, csv_path)
+        return result
+
+    def insert_from_csv_concurrent(self, csv_path: Union[str, Path],
+                                   validate: bool = True,
+                                   batch_size: int = 1000,
+                                   concurrency: int = 8) -> Dict[str, Any]:
+        """
+        Synchronous wrapper around async_insert_from_csv.
+
+        Args:
+            csv_path: Path to the CSV file
+            validate: Whether to validate each chunk before insertion
+            batch_size: Number of records per upload batch
+            concurrency: Maximum number of batches in flight at once
+
+        Returns:
+            Dictionary with insertion results (same format as
+            insert_from_dataframe)
+        """
+        return asyncio.run(self.async_insert_from_csv(
+            csv_path, validate=validate, batch_size=batch_size,
+            concurrency=concurrency))
+
+    def insert_single_signal(self, asof_date: date, ticker: str, signal_name: str,
                            value: float, metadata: Optional[Dict[str, Any]] = None) -> bool:
         """
         Insert a single signal record.
@@ -325,36 +971,34 @@ class SignalInserter:
                 print("Signal inserted successfully")
         """
         try:
-            signal = SignalRaw(
-                asof_date=asof_date,
-                ticker=ticker,
-                signal_name=signal_name,
-                value=value,
-                metadata=metadata
-            )
-            
-            # Ensure database connection
-            if not self.db_manager.ensure_connection():
-                logger.error("Failed to connect to database")
+            # Inline the SignalRaw field checks: the single-row path skips the
+            # dataclass allocation and list boxing of the bulk machinery
+            if not ticker or not isinstance(ticker, str):
+                raise ValueError("ticker must be a non-empty string")
+            if not signal_name or not isinstance(signal_name, str):
+                raise ValueError("signal_name must be a non-empty string")
+            if not isinstance(value, (int, float)):
+                raise ValueError("value must be a number")
+            if not isinstance(asof_date, date):
+                raise ValueError("asof_date must be a date object")
+
+            # One-time connection/table setup
+            if not self._ensure_initialized():
+                logger.error("Failed to initialize database connection")
                 return False
-            
-            # Create table if needed
-            if self.auto_create_table:
-                if not self.db_manager.create_signal_raw_table():
-                    logger.error("Failed to create signal_raw table")
-                    return False
-                
-                # Reset sequence to prevent ID conflicts
-                self.db_manager.reset_sequence()
-            
-            # Insert signal
-            inserted_count = self.db_manager.store_signals_raw([signal])
+
+            # Insert signal through the dedicated single-row statement
+            inserted_count = self.db_manager.insert_one_signal(
+                asof_date, ticker, signal_name, value,
+                metadata_json=_dumps(metadata) if metadata else None)
             success = inserted_count > 0
             
             if success:
-                logger.info(f"Successfully inserted signal: {ticker} {signal_name} on {asof_date}")
+                logger.info("Inserted signal: %s %s on %s",
+                            ticker, signal_name, asof_date)
             else:
-                logger.error(f"Failed to insert signal: {ticker} {signal_name} on {asof_date}")
+                logger.error("Failed to insert signal: %s %s on %s",
+                             ticker, signal_name, asof_date)
             
             return success
             
@@ -380,7 +1024,9 @@ class SignalInserter:
     def get_existing_signals(self, tickers: Optional[List[str]] = None,
                            signal_names: Optional[List[str]] = None,
                            start_date: Optional[date] = None,
-                           end_date: Optional[date] = None) -> pd.DataFrame:
+                           end_date: Optional[date] = None,
+                           stream: bool = False,
+                           chunksize: Optional[int] = None) -> pd.DataFrame:
         """
         Retrieve existing signals from the database.
         
@@ -392,13 +1038,21 @@ class SignalInserter:
             signal_names: Optional list of signal names to filter by
             start_date: Optional start date for filtering
             end_date: Optional end date for filtering
-            
+            stream: Fetch via COPY TO STDOUT (faster for >100k row results)
+            chunksize: When set, return an iterator of DataFrames of at most
+                this many rows instead of one DataFrame
+
         Returns:
-            DataFrame with existing signal data
-            
+            DataFrame with existing signal data (or an iterator of DataFrames
+            when chunksize is given)
+
         Example:
             # Get all signals for specific tickers
             existing = inserter.get_existing_signals(tickers=['AAPL', 'MSFT'])
+
+            # Iterate a large result in chunks
+            for chunk in inserter.get_existing_signals(chunksize=50_000):
+                process(chunk)
             
             # Get sentiment signals for last 30 days
             from datetime import date, timedelta
@@ -419,7 +1073,9 @@ class SignalInserter:
                 tickers=tickers,
                 signal_names=signal_names,
                 start_date=start_date,
-                end_date=end_date
+                end_date=end_date,
+                stream=stream,
+                chunksize=chunksize
             )
             
         except Exception as e: